@@ -0,0 +1,36 @@
+"""
+Job Application Coach
+Serves the Career Advisor, Cover Letter Generator, Resume Polisher and Full Pipeline from one process
+"""
+
+import gradio as gr
+from llm_clients import openai_available, claude_available, enable_queue, warm_up
+from career_advisor import career_advice_app
+from cover_letter import cover_letter_app
+from resume_polisher import resume_polish_app
+from full_pipeline import full_pipeline_app
+
+
+# One server, one set of provider connection pools and one cache shared by every tab
+job_app_coach = gr.TabbedInterface(
+    [career_advice_app, cover_letter_app, resume_polish_app, full_pipeline_app],
+    ["Advisor", "Cover Letter", "Polisher", "Full Pipeline"],
+    title="Job Application Coach"
+)
+
+
+if __name__ == "__main__":
+    print("\n" + "="*50)
+    print("💼 Job Application Coach")
+    print("="*50)
+    print(f"OpenAI Available: {'✓' if openai_available else '✗'}")
+    print(f"Claude Available: {'✓' if claude_available else '✗'}")
+    print("="*50 + "\n")
+    
+    enable_queue(job_app_coach)
+    warm_up()
+    job_app_coach.launch(
+        share=False,
+        server_name="127.0.0.1",
+        server_port=7860
+    )
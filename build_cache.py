@@ -0,0 +1,40 @@
+"""
+Build Response Cache
+Runs every Gradio example once so its answer is stored in the SQLite response cache.
+Run it at build time; afterwards clicking an example replays the cached answer at no API cost.
+The answers are pinned, so they survive LLM_CACHE_TTL and LLM_CACHE_MAX_ENTRIES.
+"""
+
+import career_advisor
+import cover_letter
+import resume_polisher
+import full_pipeline
+import cache
+
+
+APPS = [
+    ("Career Advisor", career_advisor.generate_career_advice, career_advisor.EXAMPLES),
+    ("Cover Letter", cover_letter.generate_cover_letter, cover_letter.EXAMPLES),
+    ("Resume Polisher", resume_polisher.polish_resume, resume_polisher.EXAMPLES),
+    ("Full Pipeline", full_pipeline.full_pipeline, full_pipeline.EXAMPLES)
+]
+
+
+def main():
+    print(f"Filling response cache: {cache.CACHE_PATH}")
+    cache.PIN_WRITES = True
+
+    for name, generate, examples in APPS:
+        for i, example in enumerate(examples, start=1):
+            # Drain the stream; the final text is written to the cache as a side effect
+            output = ""
+            for output in generate(*example):
+                pass
+
+            result = output[0] if isinstance(output, tuple) else output
+            status = "✗" if result.startswith(("❌", "⚠️")) else "✓"
+            print(f"{status} {name} example {i} ({example[-1]})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Exact-Match Response Cache
+Persists responses in SQLite, keyed on a SHA256 of the request
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+
+CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "llm_cache.sqlite"))
+CACHE_ENABLED = os.getenv("LLM_CACHE_DISABLED", "").lower() not in ("1", "true", "yes")
+CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 7 * 24 * 3600))  # seconds
+CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", 1000))
+
+# Set by build_cache.py: pinned rows are exempt from the TTL and from eviction
+PIN_WRITES = False
+
+_lock = threading.Lock()
+
+
+def _connect():
+    conn = sqlite3.connect(CACHE_PATH, timeout=5)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS cache(k TEXT PRIMARY KEY, v TEXT, ts INT, pinned INT NOT NULL DEFAULT 0)")
+    # Caches created before pinning existed lack the column
+    if "pinned" not in [row[1] for row in conn.execute("PRAGMA table_info(cache)")]:
+        conn.execute("ALTER TABLE cache ADD COLUMN pinned INT NOT NULL DEFAULT 0")
+    return conn
+
+
+def cache_key(model, messages, **params):
+    """Hash the parts of a request that determine its output
+
+    Only temperature and max_tokens are included, so transport options such as
+    stream or api_key never split the cache.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "t": params.get("temperature"),
+        "m": params.get("max_tokens")
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()).hexdigest()
+
+
+def get(key):
+    """Return the cached response for key, or None"""
+    with _lock:
+        conn = _connect()
+        try:
+            row = conn.execute("SELECT v FROM cache WHERE k = ? AND (pinned OR ts >= ?)", (key, int(time.time()) - CACHE_TTL)).fetchone()
+        finally:
+            conn.close()
+    return row[0] if row else None
+
+
+def put(key, value, pin=False):
+    """Store value under key, then drop expired entries and the oldest beyond CACHE_MAX_ENTRIES
+
+    Pinned entries never expire and don't count towards CACHE_MAX_ENTRIES.
+    """
+    now = int(time.time())
+    with _lock:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute("INSERT OR REPLACE INTO cache(k, v, ts, pinned) VALUES (?, ?, ?, ?)", (key, value, now, int(pin)))
+                conn.execute("DELETE FROM cache WHERE NOT pinned AND ts < ?", (now - CACHE_TTL,))
+                conn.execute("DELETE FROM cache WHERE NOT pinned AND k NOT IN (SELECT k FROM cache WHERE NOT pinned ORDER BY ts DESC, rowid DESC LIMIT ?)", (CACHE_MAX_ENTRIES,))
+        finally:
+            conn.close()
+
+
+def clear():
+    """Delete every cached response, pinned ones included"""
+    with _lock:
+        conn = _connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache")
+        finally:
+            conn.close()
+
+
+def cached(key, stream):
+    """Yield the cached response for key, or fall through to stream()
+
+    stream is a zero-argument callable returning a generator of accumulated text.
+    Nothing is stored here; wrap the real provider call in stored() so answers
+    from other cache layers never become exact matches for this key.
+    """
+    if not CACHE_ENABLED:
+        yield from stream()
+        return
+    
+    try:
+        hit = get(key)
+        # An answer cached before the build still needs pinning
+        if hit is not None and PIN_WRITES:
+            put(key, hit, pin=True)
+    except sqlite3.Error as e:
+        print(f"Response cache unavailable: {e}")
+        hit = None
+    
+    if hit is not None:
+        yield hit
+        return
+    yield from stream()
+
+
+def stored(key, texts):
+    """Pass through a stream of accumulated text and store its final text under key
+
+    Nothing is stored if the stream raises or is closed before it finishes.
+    """
+    text = ""
+    try:
+        for text in texts:
+            yield text
+    finally:
+        texts.close()
+    
+    if text and CACHE_ENABLED:
+        try:
+            put(key, text, pin=PIN_WRITES)
+        except sqlite3.Error as e:
+            print(f"Response cache unavailable: {e}")
+
+
+if __name__ == "__main__":
+    if "--clear" in sys.argv:
+        clear()
+        print(f"Cleared response cache: {CACHE_PATH}")
+    else:
+        print("Usage: python cache.py --clear")
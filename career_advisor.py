@@ -4,87 +4,82 @@ Works with both OpenAI and Claude APIs
 """
 
 import gradio as gr
-from dotenv import load_dotenv
-import os
+from llm_clients import call_openai, openai_available, call_claude, claude_available, stream_parallel, truncate_input, enable_queue, warm_up, CONCURRENCY_ID, CONCURRENCY_LIMIT
 
-# Load environment variables from .env file
-load_dotenv()
+# Static instructions come first so providers can cache the shared prefix
+SYSTEM_PROMPT = """You are a career advisor. Given a job description and a resume, identify areas for enhancement in the resume. Offer specific suggestions on how to improve these aspects to better match the job requirements and increase the likelihood of being selected for the position applied for."""
 
-# Try to import both APIs
-try:
-    from openai import OpenAI
-    openai_available = True
-    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-except Exception as e:
-    openai_available = False
-    print(f"OpenAI not available: {e}")
 
-try:
-    import anthropic
-    claude_available = True
-    claude_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-except Exception as e:
-    claude_available = False
-    print(f"Claude not available: {e}")
-
-
-def generate_career_advice_openai(position_applied, job_description, resume_content):
+def generate_career_advice_openai(position_applied, job_description, resume_content, session=None):
     """Generate career advice using OpenAI GPT"""
     
-    prompt = f"""Considering the job description: {job_description}, and the resume provided: {resume_content}, identify areas for enhancement in the resume. Offer specific suggestions on how to improve these aspects to better match the job requirements and increase the likelihood of being selected for the position of {position_applied}."""
+    prompt = f"Position: {position_applied}\n\nJob Description:\n{job_description}\n\nResume:\n{resume_content}"
     
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",  # Cost-effective model
-            messages=[
-                {"role": "user", "content": prompt}
-            ],
-            max_tokens=1024,
-            temperature=0.7
-        )
-        
-        return response.choices[0].message.content
+        yield from call_openai(prompt, max_tokens=1024, system=SYSTEM_PROMPT, stream=True, feature="career_advice", session=session)
     
     except Exception as e:
-        return f"❌ Error with OpenAI API: {str(e)}\n\nPlease check:\n1. Your OPENAI_API_KEY in .env file\n2. You have credits in your OpenAI account\n3. Internet connection"
+        yield f"❌ Error with OpenAI API: {str(e)}\n\nPlease check:\n1. Your OPENAI_API_KEY in .env file\n2. You have credits in your OpenAI account\n3. Internet connection"
 
 
 def generate_career_advice_claude(position_applied, job_description, resume_content):
     """Generate career advice using Claude"""
     
-    prompt = f"""Considering the job description: {job_description}, and the resume provided: {resume_content}, identify areas for enhancement in the resume. Offer specific suggestions on how to improve these aspects to better match the job requirements and increase the likelihood of being selected for the position of {position_applied}."""
+    prompt = f"Position: {position_applied}\n\nJob Description:\n{job_description}\n\nResume:\n{resume_content}"
     
     try:
-        message = claude_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=1024,
-            temperature=0.7,
-            messages=[
-                {"role": "user", "content": prompt}
-            ]
-        )
-        
-        return message.content[0].text
+        yield from call_claude(prompt, max_tokens=1024, system=SYSTEM_PROMPT, stream=True)
     
     except Exception as e:
-        return f"❌ Error with Claude API: {str(e)}\n\nPlease check:\n1. Your ANTHROPIC_API_KEY in .env file\n2. You have credits in your Claude account\n3. Internet connection"
+        yield f"❌ Error with Claude API: {str(e)}\n\nPlease check:\n1. Your ANTHROPIC_API_KEY in .env file\n2. You have credits in your Claude account\n3. Internet connection"
 
 
-def generate_career_advice(position_applied, job_description, resume_content, api_choice):
+def generate_career_advice(position_applied, job_description, resume_content, api_choice, request: gr.Request = None):
     """Main function that routes to the selected API"""
     
     if not position_applied or not job_description or not resume_content:
-        return "⚠️ Please fill in all fields before submitting."
+        yield "⚠️ Please fill in all fields before submitting."
+        return
+    
+    # Cap oversized inputs to bound cost and prefill latency
+    job_description = truncate_input(job_description, "Job Description")
+    resume_content = truncate_input(resume_content, "Resume")
+    
+    # Scopes the semantic cache so answers are never shared between users
+    session = request.session_hash if request else None
     
     if api_choice == "OpenAI GPT-4":
         if not openai_available:
-            return "❌ OpenAI is not properly configured. Please install: pip install openai"
-        return generate_career_advice_openai(position_applied, job_description, resume_content)
+            yield "❌ OpenAI is not properly configured. Please install: pip install openai and set OPENAI_API_KEY in your .env file"
+            return
+        yield from generate_career_advice_openai(position_applied, job_description, resume_content, session=session)
     
     elif api_choice == "Claude (Anthropic)":
         if not claude_available:
-            return "❌ Claude is not properly configured. Please install: pip install anthropic"
-        return generate_career_advice_claude(position_applied, job_description, resume_content)
+            yield "❌ Claude is not properly configured. Please install: pip install anthropic and set ANTHROPIC_API_KEY in your .env file"
+            return
+        yield from generate_career_advice_claude(position_applied, job_description, resume_content)
+    
+    elif api_choice == "Both (parallel)":
+        if not openai_available or not claude_available:
+            yield "❌ Both OpenAI and Claude must be configured to compare them side by side."
+            return
+        for openai_text, claude_text in stream_parallel(
+            generate_career_advice_openai(position_applied, job_description, resume_content, session=session),
+            generate_career_advice_claude(position_applied, job_description, resume_content)
+        ):
+            yield f"### OpenAI\n{openai_text}\n\n### Claude\n{claude_text}"
+
+
+# Example rows are pre-run into the response cache by build_cache.py
+EXAMPLES = [
+    [
+        "Data Scientist",
+        "We are seeking a Data Scientist with strong Python skills, experience in machine learning, and knowledge of deep learning frameworks.",
+        "Data Analyst with 2 years experience in Python and SQL. Built dashboards using Tableau.",
+        "OpenAI GPT-4"
+    ]
+]
 
 
 # Create Gradio interface
@@ -94,7 +89,7 @@ with gr.Blocks(title="Career Advisor") as career_advice_app:
     
     with gr.Row():
         api_choice = gr.Radio(
-            choices=["OpenAI GPT-4", "Claude (Anthropic)"],
+            choices=["OpenAI GPT-4", "Claude (Anthropic)", "Both (parallel)"],
             value="OpenAI GPT-4",
             label="Choose AI Model",
             info="Select which AI to use for analysis"
@@ -131,21 +126,17 @@ with gr.Blocks(title="Career Advisor") as career_advice_app:
     
     # Examples
     gr.Examples(
-        examples=[
-            [
-                "Data Scientist",
-                "We are seeking a Data Scientist with strong Python skills, experience in machine learning, and knowledge of deep learning frameworks.",
-                "Data Analyst with 2 years experience in Python and SQL. Built dashboards using Tableau.",
-                "OpenAI GPT-4"
-            ]
-        ],
+        examples=EXAMPLES,
+        cache_examples=False,
         inputs=[position_input, job_desc_input, resume_input, api_choice]
     )
     
     submit_btn.click(
         fn=generate_career_advice,
         inputs=[position_input, job_desc_input, resume_input, api_choice],
-        outputs=output
+        outputs=output,
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id=CONCURRENCY_ID
     )
 
 
@@ -157,6 +148,8 @@ if __name__ == "__main__":
     print(f"Claude Available: {'✓' if claude_available else '✗'}")
     print("="*50 + "\n")
     
+    enable_queue(career_advice_app)
+    warm_up()
     career_advice_app.launch(
         share=False,
         server_name="127.0.0.1",
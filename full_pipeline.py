@@ -0,0 +1,205 @@
+"""
+Full Pipeline Application
+Produces career advice, a polished resume and a cover letter in a single LLM call
+"""
+
+import re
+
+import gradio as gr
+from llm_clients import call_openai, openai_available, call_claude, claude_available, truncate_input, enable_queue, warm_up, CONCURRENCY_ID, CONCURRENCY_LIMIT
+
+SECTION_MARKERS = ["### ADVICE ###", "### POLISHED ###", "### COVER LETTER ###"]
+
+# Static instructions come first so providers can cache the shared prefix
+SYSTEM_PROMPT = """You are a career coach preparing a complete job application from a job description and a resume. Produce exactly three sections, each starting with its marker on its own line:
+
+### ADVICE ###
+Identify areas for enhancement in the resume. Offer specific suggestions on how to improve these aspects to better match the job requirements and increase the likelihood of being selected for the position.
+
+### POLISHED ###
+Return a polished version of the resume that better aligns with the requirements and expectations of the position, with adjustments for clarity, relevance, and impact.
+
+### COVER LETTER ###
+Write a customized cover letter for the company and position that highlights the applicant's qualifications and experience as detailed in the resume. Do not include experiences not present in the resume but mentioned in the job description. Emphasize the alignment between the applicant's existing skills and the requirements of the role."""
+
+# One call replaces three, so it gets the combined output budget
+MAX_TOKENS = 2400
+
+
+def split_sections(text):
+    """Split model output into (advice, polished resume, cover letter) on the section markers"""
+    pattern = "(" + "|".join(re.escape(marker) for marker in SECTION_MARKERS) + ")"
+    sections = {}
+    current = None
+    for part in re.split(pattern, text):
+        if part in SECTION_MARKERS:
+            current = part
+        elif current:
+            sections[current] = sections.get(current, "") + part
+    
+    # Without any markers, show the raw output rather than nothing
+    if not sections:
+        return text.strip(), "", ""
+    return tuple(sections.get(marker, "").strip() for marker in SECTION_MARKERS)
+
+
+def full_pipeline_openai(company_name, position_name, job_description, resume_content, session=None):
+    """Generate the full application using OpenAI GPT"""
+    
+    prompt = f"Company: {company_name}\n\nPosition: {position_name}\n\nJob Description:\n{job_description}\n\nResume:\n{resume_content}"
+    
+    try:
+        yield from call_openai(prompt, max_tokens=MAX_TOKENS, system=SYSTEM_PROMPT, stream=True, feature="full_pipeline", session=session)
+    
+    except Exception as e:
+        yield f"❌ Error with OpenAI API: {str(e)}\n\nPlease check:\n1. Your OPENAI_API_KEY in .env file\n2. You have credits in your OpenAI account\n3. Internet connection"
+
+
+def full_pipeline_claude(company_name, position_name, job_description, resume_content):
+    """Generate the full application using Claude"""
+    
+    prompt = f"Company: {company_name}\n\nPosition: {position_name}\n\nJob Description:\n{job_description}\n\nResume:\n{resume_content}"
+    
+    try:
+        yield from call_claude(prompt, max_tokens=MAX_TOKENS, system=SYSTEM_PROMPT, stream=True)
+    
+    except Exception as e:
+        yield f"❌ Error with Claude API: {str(e)}\n\nPlease check:\n1. Your ANTHROPIC_API_KEY in .env file\n2. You have credits in your Claude account\n3. Internet connection"
+
+
+def full_pipeline(company_name, position_name, job_description, resume_content, api_choice, request: gr.Request = None):
+    """Main function that routes to the selected API and splits the output into three sections"""
+    
+    if not company_name or not position_name or not job_description or not resume_content:
+        yield "⚠️ Please fill in all fields before submitting.", "", ""
+        return
+    
+    # Cap oversized inputs to bound cost and prefill latency
+    job_description = truncate_input(job_description, "Job Description")
+    resume_content = truncate_input(resume_content, "Resume")
+    
+    # Scopes the semantic cache so answers are never shared between users
+    session = request.session_hash if request else None
+    
+    if api_choice == "OpenAI GPT-4":
+        if not openai_available:
+            yield "❌ OpenAI is not properly configured. Please install: pip install openai and set OPENAI_API_KEY in your .env file", "", ""
+            return
+        stream = full_pipeline_openai(company_name, position_name, job_description, resume_content, session=session)
+    
+    elif api_choice == "Claude (Anthropic)":
+        if not claude_available:
+            yield "❌ Claude is not properly configured. Please install: pip install anthropic and set ANTHROPIC_API_KEY in your .env file", "", ""
+            return
+        stream = full_pipeline_claude(company_name, position_name, job_description, resume_content)
+    
+    else:
+        return
+    
+    for text in stream:
+        yield split_sections(text)
+
+
+# Example rows are pre-run into the response cache by build_cache.py
+EXAMPLES = [
+    [
+        "TechCorp",
+        "Data Scientist",
+        "We are seeking a Data Scientist with strong Python skills, experience in machine learning, and knowledge of deep learning frameworks.",
+        "Data Analyst with 2 years experience in Python and SQL. Built dashboards using Tableau.",
+        "OpenAI GPT-4"
+    ]
+]
+
+
+# Create Gradio interface
+with gr.Blocks(title="Full Pipeline") as full_pipeline_app:
+    gr.Markdown("# 🚀 Full Application Pipeline")
+    gr.Markdown("Get career advice, a polished resume and a cover letter from a single request.")
+    
+    with gr.Row():
+        api_choice = gr.Radio(
+            choices=["OpenAI GPT-4", "Claude (Anthropic)"],
+            value="OpenAI GPT-4",
+            label="Choose AI Model",
+            info="Select which AI to use for generation"
+        )
+    
+    with gr.Row():
+        with gr.Column():
+            company_input = gr.Textbox(
+                label="Company Name",
+                placeholder="e.g., Microsoft",
+                lines=1
+            )
+            
+            position_input = gr.Textbox(
+                label="Position Name",
+                placeholder="e.g., Senior Data Scientist",
+                lines=1
+            )
+            
+            job_desc_input = gr.Textbox(
+                label="Job Description",
+                placeholder="Paste the full job description here...",
+                lines=10
+            )
+            
+            resume_input = gr.Textbox(
+                label="Your Resume Content",
+                placeholder="Paste your resume content here...",
+                lines=10
+            )
+            
+            submit_btn = gr.Button("Run Full Pipeline", variant="primary")
+        
+        with gr.Column():
+            advice_output = gr.Textbox(
+                label="Career Advice",
+                lines=12,
+                placeholder="Your personalized career advice will appear here..."
+            )
+            
+            polished_output = gr.Textbox(
+                label="Polished Resume",
+                lines=12,
+                placeholder="Your improved resume will appear here..."
+            )
+            
+            cover_letter_output = gr.Textbox(
+                label="Cover Letter",
+                lines=12,
+                placeholder="Your customized cover letter will appear here..."
+            )
+    
+    # Examples
+    gr.Examples(
+        examples=EXAMPLES,
+        cache_examples=False,
+        inputs=[company_input, position_input, job_desc_input, resume_input, api_choice]
+    )
+    
+    submit_btn.click(
+        fn=full_pipeline,
+        inputs=[company_input, position_input, job_desc_input, resume_input, api_choice],
+        outputs=[advice_output, polished_output, cover_letter_output],
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id=CONCURRENCY_ID
+    )
+
+
+if __name__ == "__main__":
+    print("\n" + "="*50)
+    print("🚀 Full Pipeline Application")
+    print("="*50)
+    print(f"OpenAI Available: {'✓' if openai_available else '✗'}")
+    print(f"Claude Available: {'✓' if claude_available else '✗'}")
+    print("="*50 + "\n")
+    
+    enable_queue(full_pipeline_app)
+    warm_up()
+    full_pipeline_app.launch(
+        share=False,
+        server_name="127.0.0.1",
+        server_port=7863
+    )
@@ -0,0 +1,352 @@
+"""
+Shared LLM Clients
+Creates the OpenAI and Claude clients on first use, each on its own pooled keep-alive HTTP connection
+"""
+
+import atexit
+from dotenv import load_dotenv
+import functools
+import importlib.util
+import os
+import queue
+import threading
+import time
+
+import cache
+from semantic_cache import SemanticCache
+
+# Load environment variables from .env file
+load_dotenv()
+
+
+def _check_available(name, package, key_name):
+    """Report whether a provider can be used without importing its SDK"""
+    if not os.getenv(key_name):
+        print(f"{name} not available: {key_name} is not set")
+        return False
+    if importlib.util.find_spec(package) is None:
+        print(f"{name} not available: {package} is not installed")
+        return False
+    return True
+
+
+openai_available = _check_available("OpenAI", "openai", "OPENAI_API_KEY")
+claude_available = _check_available("Claude", "anthropic", "ANTHROPIC_API_KEY")
+
+OPENAI_MODEL = "gpt-4o-mini"  # Cost-effective model
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+EMBEDDING_MODEL = "text-embedding-3-small"
+TEMPERATURE = 0.7
+
+# Output budget: callers' max_tokens is lowered if the prompt leaves less context
+MODEL_CONTEXT = {OPENAI_MODEL: 128000, CLAUDE_MODEL: 200000}
+MAX_OUTPUT_TOKENS = 2048
+MIN_OUTPUT_TOKENS = 256
+CONTEXT_SAFETY_MARGIN = 512
+
+
+def _pooled_http_client(default_client_class):
+    """Build a keep-alive connection pool from an SDK's DefaultHttpxClient
+
+    Each SDK checks that http_client comes from the httpx build it was made for,
+    so Limits and Timeout are taken from the same package as its client class.
+    Keep-alive connections are per host, so each provider gets its own pool.
+    """
+    base_client = next(cls for cls in default_client_class.__mro__ if cls.__name__ == "Client")
+    httpx = importlib.import_module(base_client.__module__.split(".")[0])
+    
+    # HTTP/2 needs the optional h2 package (pip install httpx[http2])
+    client = default_client_class(
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+        timeout=httpx.Timeout(60.0, connect=5.0)
+    )
+    atexit.register(client.close)
+    return client
+
+
+def _create_once(create):
+    """Cache create()'s result like functools.lru_cache, holding a lock while it runs
+
+    lru_cache alone lets warm_up()'s thread and the first request each build a
+    client, leaving one connection pool orphaned with its atexit close registered.
+    """
+    cached = functools.lru_cache(maxsize=1)(create)
+    lock = threading.Lock()
+    
+    @functools.wraps(create)
+    def get():
+        with lock:
+            return cached()
+    return get
+
+
+@_create_once
+def get_openai_client():
+    """Import the OpenAI SDK and create its client on first use"""
+    import openai
+    return openai.OpenAI(api_key=os.getenv("OPENAI_API_KEY"), http_client=_pooled_http_client(openai.DefaultHttpxClient))
+
+
+@_create_once
+def get_claude_client():
+    """Import the Anthropic SDK and create its client on first use"""
+    import anthropic
+    return anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"), http_client=_pooled_http_client(anthropic.DefaultHttpxClient))
+
+
+# Per-field cap on pasted job descriptions and resumes
+MAX_INPUT_TOKENS = 4000
+CHARS_PER_TOKEN = 4  # rough estimate used when tiktoken is unavailable
+
+
+@functools.lru_cache(maxsize=1)
+def get_encoding():
+    """Load the tiktoken encoder on first use, or None when tiktoken is unavailable"""
+    if importlib.util.find_spec("tiktoken") is None:
+        return None
+    try:
+        import tiktoken
+        return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        print(f"Token limits disabled: {e}")
+        return None
+
+
+def truncate_input(text, label, max_tokens=MAX_INPUT_TOKENS):
+    """Cut text to at most max_tokens tokens, warning the user in the UI when it was longer
+
+    Without tiktoken the cap falls back to max_tokens * CHARS_PER_TOKEN characters.
+    """
+    import gradio as gr
+    
+    encoding = get_encoding()
+    if encoding is None:
+        max_chars = max_tokens * CHARS_PER_TOKEN
+        if len(text) <= max_chars:
+            return text
+        gr.Warning(f"{label} truncated from {len(text)} to {max_chars} characters")
+        return text[:max_chars]
+    
+    tokens = encoding.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    
+    gr.Warning(f"{label} truncated from {len(tokens)} to {max_tokens} tokens")
+    return encoding.decode(tokens[:max_tokens])
+
+
+def count_tokens(text):
+    """Count tokens with tiktoken, or estimate at CHARS_PER_TOKEN characters per token without it"""
+    encoding = get_encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode(text))
+
+
+def output_budget(model, prompt, system=None, max_tokens=MAX_OUTPUT_TOKENS):
+    """Return max_tokens, reduced if needed to fit the context window left after the prompt"""
+    # o200k_base is OpenAI's tokenizer; for Claude prompts the count is an approximation
+    input_tokens = count_tokens(prompt) + (count_tokens(system) if system else 0)
+    return max(MIN_OUTPUT_TOKENS, min(max_tokens, MODEL_CONTEXT[model] - input_tokens - CONTEXT_SAFETY_MARGIN))
+
+
+def _warm_up(name, request):
+    try:
+        request()
+    except Exception as e:
+        print(f"{name} warm-up failed: {e}")
+
+
+def warm_up():
+    """Open pooled connections to the configured providers in the background
+
+    Listing models is free, and it leaves a TLS connection in the keep-alive
+    pool so the first real request skips the handshake.
+    """
+    if openai_available:
+        threading.Thread(target=_warm_up, args=("OpenAI", lambda: get_openai_client().models.list()), daemon=True).start()
+    if claude_available:
+        threading.Thread(target=_warm_up, args=("Claude", lambda: get_claude_client().models.list(limit=1)), daemon=True).start()
+
+
+# Every tool's submit handler joins this Gradio concurrency group, so the limit
+# covers all tools together, including when app.py serves them as tabs
+CONCURRENCY_ID = "llm"
+CONCURRENCY_LIMIT = 4
+QUEUE_SIZE = 32
+
+
+def enable_queue(app):
+    """Bound concurrent generations so one long stream can't starve other users
+
+    At most CONCURRENCY_LIMIT requests stream at once and QUEUE_SIZE more wait in line.
+    """
+    return app.queue(default_concurrency_limit=CONCURRENCY_LIMIT, max_size=QUEUE_SIZE)
+
+
+def stream_parallel(*streams):
+    """Drive several streaming generators at once, yielding the latest text of each
+
+    Each stream runs in its own thread, so total latency is that of the slowest
+    provider rather than the sum of all of them. If the consumer stops early
+    (e.g. the Gradio event is cancelled), every stream is closed so its HTTP
+    response is released instead of generating to completion.
+    """
+    latest = [""] * len(streams)
+    updates = queue.Queue()
+    stop = threading.Event()
+    
+    def pump(index, stream):
+        try:
+            for text in stream:
+                if stop.is_set():
+                    break
+                updates.put((index, text))
+        finally:
+            # Runs on the pump thread, which is the only one iterating stream
+            stream.close()
+            updates.put((index, None))
+    
+    for index, stream in enumerate(streams):
+        threading.Thread(target=pump, args=(index, stream), daemon=True).start()
+    
+    remaining = len(streams)
+    try:
+        while remaining:
+            index, text = updates.get()
+            if text is None:
+                remaining -= 1
+                continue
+            latest[index] = text
+            yield tuple(latest)
+    finally:
+        stop.set()
+
+
+def throttle(stream, min_interval=0.05, min_chars=40):
+    """Batch a stream of accumulated text into fewer UI updates
+
+    Yielding on every token floods Gradio's event loop on fast streams, so text
+    is only yielded once min_interval seconds have passed or min_chars new
+    characters have arrived. The first token and the final text always go out.
+    """
+    last_yield = 0.0
+    last_len = 0
+    text = ""
+    try:
+        for text in stream:
+            now = time.monotonic()
+            if now - last_yield >= min_interval or len(text) - last_len >= min_chars:
+                yield text
+                last_yield = now
+                last_len = len(text)
+    finally:
+        stream.close()
+    if len(text) != last_len:
+        yield text
+
+
+def _embed(text):
+    response = get_openai_client().embeddings.create(model=EMBEDDING_MODEL, input=text)
+    return response.data[0].embedding
+
+
+# Opt-in: prompts are embedded with OpenAI, so only OpenAI requests use it
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE", "").lower() in ("1", "true", "yes")
+semantic_cache = SemanticCache(_embed) if openai_available and SEMANTIC_CACHE_ENABLED else None
+
+
+def _cached_stream(model, key_messages, max_tokens, request, prompt=None, semantic_namespace=None):
+    """Layer the exact-match cache, semantic cache and UI throttling over a streaming request"""
+    key = cache.cache_key(model, key_messages, temperature=TEMPERATURE, max_tokens=max_tokens)
+    
+    # Only a real provider answer is ever written to the exact-match cache
+    def fresh():
+        return cache.stored(key, throttle(request()))
+    
+    def semantic():
+        if semantic_cache is None or semantic_namespace is None:
+            return fresh()
+        return semantic_cache.cached(semantic_namespace, prompt, fresh)
+    
+    return cache.cached(key, semantic)
+
+
+def _final_text(texts):
+    text = ""
+    for text in texts:
+        pass
+    return text
+
+
+def call_openai(prompt, max_tokens=MAX_OUTPUT_TOKENS, system=None, stream=False, feature=None, session=None):
+    """Send prompt to OpenAI GPT through the response caches
+
+    Returns the response text, or with stream=True a generator of the accumulated
+    text. max_tokens is an upper bound; see output_budget. The semantic cache is
+    only consulted with a session, and is scoped to that session and feature so
+    answers never cross users or tools.
+    """
+    max_tokens = output_budget(OPENAI_MODEL, prompt, system, max_tokens)
+    messages = [{"role": "user", "content": prompt}]
+    if system:
+        messages.insert(0, {"role": "system", "content": system})
+    
+    def request():
+        response = get_openai_client().chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            stream=True,
+            stream_options={"include_usage": True}
+        )
+        
+        text = ""
+        try:
+            for chunk in response:
+                # The trailing usage chunk has no choices
+                if chunk.choices and chunk.choices[0].delta.content:
+                    text += chunk.choices[0].delta.content
+                    yield text
+                if chunk.usage:
+                    print(f"OpenAI usage: {chunk.usage.prompt_tokens} prompt / {chunk.usage.completion_tokens} completion tokens")
+        finally:
+            # Releases the HTTP connection if the caller stops early
+            response.close()
+    
+    semantic_namespace = (session, feature, OPENAI_MODEL) if session else None
+    texts = _cached_stream(OPENAI_MODEL, messages, max_tokens, request, prompt, semantic_namespace)
+    return texts if stream else _final_text(texts)
+
+
+def call_claude(prompt, max_tokens=MAX_OUTPUT_TOKENS, system=None, stream=False):
+    """Send prompt to Claude through the response caches
+
+    Returns the response text, or with stream=True a generator of the accumulated
+    text. max_tokens is an upper bound; see output_budget. The system prompt is
+    marked for Anthropic's prompt caching.
+    """
+    max_tokens = output_budget(CLAUDE_MODEL, prompt, system, max_tokens)
+    messages = [{"role": "user", "content": prompt}]
+    params = {}
+    if system:
+        params["system"] = [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}]
+    
+    def request():
+        with get_claude_client().messages.stream(
+            model=CLAUDE_MODEL,
+            max_tokens=max_tokens,
+            temperature=TEMPERATURE,
+            messages=messages,
+            **params
+        ) as response:
+            text = ""
+            for delta in response.text_stream:
+                text += delta
+                yield text
+    
+    key_messages = ([{"role": "system", "content": system}] if system else []) + messages
+    texts = _cached_stream(CLAUDE_MODEL, key_messages, max_tokens, request)
+    return texts if stream else _final_text(texts)
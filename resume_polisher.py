@@ -4,95 +4,93 @@ Works with both OpenAI and Claude APIs
 """
 
 import gradio as gr
-from dotenv import load_dotenv
-import os
+from llm_clients import call_openai, openai_available, call_claude, claude_available, stream_parallel, truncate_input, enable_queue, warm_up, CONCURRENCY_ID, CONCURRENCY_LIMIT
 
-# Load environment variables from .env file
-load_dotenv()
+# Static instructions come first so providers can cache the shared prefix
+SYSTEM_PROMPT = """You are a resume editor. Polish the resume content provided so it better aligns with the requirements and expectations of the target position. If polish instructions are given, follow them. Otherwise suggest improvements and return the polished version, highlighting necessary adjustments for clarity, relevance, and impact in relation to the targeted role."""
 
-# Try to import both APIs
-try:
-    from openai import OpenAI
-    openai_available = True
-    openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-except Exception as e:
-    openai_available = False
-    print(f"OpenAI not available: {e}")
 
-try:
-    import anthropic
-    claude_available = True
-    claude_client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-except Exception as e:
-    claude_available = False
-    print(f"Claude not available: {e}")
-
-
-def polish_resume_openai(position_name, resume_content, polish_prompt=""):
+def polish_resume_openai(position_name, resume_content, polish_prompt="", session=None):
     """Polish resume using OpenAI GPT"""
     
-    # Check if polish_prompt is provided and adjust accordingly
+    # Only include the instructions section when polish_prompt is provided
+    prompt_use = f"Position: {position_name}\n\nResume Content:\n{resume_content}"
     if polish_prompt and polish_prompt.strip():
-        prompt_use = f"Given the resume content: '{resume_content}', polish it based on the following instructions: {polish_prompt} for the {position_name} position."
-    else:
-        prompt_use = f"Suggest improvements for the following resume content: '{resume_content}' to better align with the requirements and expectations of a {position_name} position. Return the polished version, highlighting necessary adjustments for clarity, relevance, and impact in relation to the targeted role."
+        prompt_use += f"\n\nPolish Instructions:\n{polish_prompt}"
     
     try:
-        response = openai_client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[
-                {"role": "user", "content": prompt_use}
-            ],
-            max_tokens=800,
-            temperature=0.7
-        )
-        
-        return response.choices[0].message.content
+        yield from call_openai(prompt_use, max_tokens=800, system=SYSTEM_PROMPT, stream=True, feature="resume_polish", session=session)
     
     except Exception as e:
-        return f"❌ Error with OpenAI API: {str(e)}\n\nPlease check:\n1. Your OPENAI_API_KEY in .env file\n2. You have credits in your OpenAI account\n3. Internet connection"
+        yield f"❌ Error with OpenAI API: {str(e)}\n\nPlease check:\n1. Your OPENAI_API_KEY in .env file\n2. You have credits in your OpenAI account\n3. Internet connection"
 
 
 def polish_resume_claude(position_name, resume_content, polish_prompt=""):
     """Polish resume using Claude"""
     
-    # Check if polish_prompt is provided and adjust accordingly
+    # Only include the instructions section when polish_prompt is provided
+    prompt_use = f"Position: {position_name}\n\nResume Content:\n{resume_content}"
     if polish_prompt and polish_prompt.strip():
-        prompt_use = f"Given the resume content: '{resume_content}', polish it based on the following instructions: {polish_prompt} for the {position_name} position."
-    else:
-        prompt_use = f"Suggest improvements for the following resume content: '{resume_content}' to better align with the requirements and expectations of a {position_name} position. Return the polished version, highlighting necessary adjustments for clarity, relevance, and impact in relation to the targeted role."
+        prompt_use += f"\n\nPolish Instructions:\n{polish_prompt}"
     
     try:
-        message = claude_client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=800,
-            temperature=0.7,
-            messages=[
-                {"role": "user", "content": prompt_use}
-            ]
-        )
-        
-        return message.content[0].text
+        yield from call_claude(prompt_use, max_tokens=800, system=SYSTEM_PROMPT, stream=True)
     
     except Exception as e:
-        return f"❌ Error with Claude API: {str(e)}\n\nPlease check:\n1. Your ANTHROPIC_API_KEY in .env file\n2. You have credits in your Claude account\n3. Internet connection"
+        yield f"❌ Error with Claude API: {str(e)}\n\nPlease check:\n1. Your ANTHROPIC_API_KEY in .env file\n2. You have credits in your Claude account\n3. Internet connection"
 
 
-def polish_resume(position_name, resume_content, polish_prompt, api_choice):
+def polish_resume(position_name, resume_content, polish_prompt, api_choice, request: gr.Request = None):
     """Main function that routes to the selected API"""
     
     if not position_name or not resume_content:
-        return "⚠️ Please fill in Position Name and Resume Content."
+        yield "⚠️ Please fill in Position Name and Resume Content."
+        return
+    
+    # Cap oversized inputs to bound cost and prefill latency
+    resume_content = truncate_input(resume_content, "Resume Content")
+    
+    # Scopes the semantic cache so answers are never shared between users
+    session = request.session_hash if request else None
     
     if api_choice == "OpenAI GPT-4":
         if not openai_available:
-            return "❌ OpenAI is not properly configured. Please install: pip install openai"
-        return polish_resume_openai(position_name, resume_content, polish_prompt)
+            yield "❌ OpenAI is not properly configured. Please install: pip install openai and set OPENAI_API_KEY in your .env file"
+            return
+        yield from polish_resume_openai(position_name, resume_content, polish_prompt, session=session)
     
     elif api_choice == "Claude (Anthropic)":
         if not claude_available:
-            return "❌ Claude is not properly configured. Please install: pip install anthropic"
-        return polish_resume_claude(position_name, resume_content, polish_prompt)
+            yield "❌ Claude is not properly configured. Please install: pip install anthropic and set ANTHROPIC_API_KEY in your .env file"
+            return
+        yield from polish_resume_claude(position_name, resume_content, polish_prompt)
+    
+    elif api_choice == "Both (parallel)":
+        if not openai_available or not claude_available:
+            yield "❌ Both OpenAI and Claude must be configured to compare them side by side."
+            return
+        for openai_text, claude_text in stream_parallel(
+            polish_resume_openai(position_name, resume_content, polish_prompt, session=session),
+            polish_resume_claude(position_name, resume_content, polish_prompt)
+        ):
+            yield f"### OpenAI\n{openai_text}\n\n### Claude\n{claude_text}"
+
+
+# Example rows are pre-run into the response cache by build_cache.py
+EXAMPLES = [
+    [
+        "Data Scientist",
+        "Designed and implemented a machine learning system that predicts hardware malfunction with more than 80% accuracy.",
+        "Use random forest model. Make it more specific and eye-catching. Mention cost savings of 20%.",
+        "OpenAI GPT-4"
+    ],
+    [
+        "Software Engineer",
+        "Developed web applications using React and Node.js. Worked on multiple projects.",
+        "Add more technical details and quantify the impact",
+        "Claude (Anthropic)"
+    ]
+]
 
 
 # Create Gradio interface
@@ -102,7 +100,7 @@ with gr.Blocks(title="Resume Polisher") as resume_polish_app:
     
     with gr.Row():
         api_choice = gr.Radio(
-            choices=["OpenAI GPT-4", "Claude (Anthropic)"],
+            choices=["OpenAI GPT-4", "Claude (Anthropic)", "Both (parallel)"],
             value="OpenAI GPT-4",
             label="Choose AI Model",
             info="Select which AI to use for polishing"
@@ -141,27 +139,17 @@ with gr.Blocks(title="Resume Polisher") as resume_polish_app:
     
     # Examples
     gr.Examples(
-        examples=[
-            [
-                "Data Scientist",
-                "Designed and implemented a machine learning system that predicts hardware malfunction with more than 80% accuracy.",
-                "Use random forest model. Make it more specific and eye-catching. Mention cost savings of 20%.",
-                "OpenAI GPT-4"
-            ],
-            [
-                "Software Engineer",
-                "Developed web applications using React and Node.js. Worked on multiple projects.",
-                "Add more technical details and quantify the impact",
-                "Claude (Anthropic)"
-            ]
-        ],
+        examples=EXAMPLES,
+        cache_examples=False,
         inputs=[position_input, resume_input, polish_input, api_choice]
     )
     
     submit_btn.click(
         fn=polish_resume,
         inputs=[position_input, resume_input, polish_input, api_choice],
-        outputs=output
+        outputs=output,
+        concurrency_limit=CONCURRENCY_LIMIT,
+        concurrency_id=CONCURRENCY_ID
     )
 
 
@@ -173,6 +161,8 @@ if __name__ == "__main__":
     print(f"Claude Available: {'✓' if claude_available else '✗'}")
     print("="*50 + "\n")
     
+    enable_queue(resume_polish_app)
+    warm_up()
     resume_polish_app.launch(
         share=False,
         server_name="127.0.0.1",
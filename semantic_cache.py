@@ -0,0 +1,99 @@
+"""
+Semantic Response Cache
+Reuses a previous answer when a new prompt is nearly identical to one already sent
+"""
+
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import threading
+
+import numpy as np
+
+SIMILARITY_THRESHOLD = 0.92
+MAX_ENTRIES = 256
+MAX_NAMESPACES = 128
+EMBED_TIMEOUT = 0.3  # seconds to wait for an embedding before sending the request anyway
+
+# Embeddings run here so a slow one can be abandoned after EMBED_TIMEOUT
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="semantic-cache")
+
+
+class SemanticCache:
+    """In-memory nearest-neighbour cache of prompt embeddings -> responses
+
+    embed is a callable that turns a prompt into an embedding vector.
+    """
+
+    def __init__(self, embed, threshold=SIMILARITY_THRESHOLD, max_entries=MAX_ENTRIES):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # namespace -> (embedding matrix, list of responses)
+        self._lock = threading.Lock()
+
+    def _embed(self, prompt):
+        vector = np.asarray(self.embed(prompt), dtype=np.float32)
+        return vector / np.linalg.norm(vector)
+
+    def lookup(self, namespace, embedding):
+        """Return the cached response closest to embedding, or None below the threshold"""
+        with self._lock:
+            if namespace not in self._entries:
+                return None
+            matrix, responses = self._entries[namespace]
+
+        # Vectors are normalised, so the dot product is the cosine similarity
+        scores = matrix @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] >= self.threshold:
+            return responses[best]
+        return None
+
+    def store(self, namespace, embedding, response):
+        """Remember response for embedding, evicting the oldest entry and namespace when full"""
+        with self._lock:
+            matrix, responses = self._entries.pop(namespace, (np.empty((0, embedding.size), dtype=np.float32), []))
+            matrix = np.vstack([matrix, embedding])[-self.max_entries:]
+            responses = (responses + [response])[-self.max_entries:]
+            self._entries[namespace] = (matrix, responses)
+            while len(self._entries) > MAX_NAMESPACES:
+                self._entries.popitem(last=False)
+
+    def cached(self, namespace, prompt, stream):
+        """Yield a cached response for prompt, or the output of stream(), remembering its final text
+
+        stream is a zero-argument callable returning a generator of accumulated text.
+        The prompt is embedded first, so a hit returns without calling stream() at
+        all. The wait is bounded by EMBED_TIMEOUT; if the embedding is slower or
+        fails, stream() runs as if the cache missed. Exceptions from stream()
+        propagate and nothing is cached.
+        """
+        pending = _executor.submit(self._embed, prompt)
+        embedding = None
+        try:
+            embedding = pending.result(timeout=EMBED_TIMEOUT)
+        except TimeoutError:
+            pass
+        except Exception as e:
+            # Caching is best-effort; never fail generation on the embeddings API
+            print(f"Semantic cache unavailable: {e}")
+        
+        if embedding is not None:
+            hit = self.lookup(namespace, embedding)
+            if hit is not None:
+                yield hit
+                return
+        
+        texts = stream()
+        text = ""
+        try:
+            for text in texts:
+                yield text
+        finally:
+            texts.close()
+        
+        # A slow embedding has usually finished by now and can still be stored
+        if embedding is None and pending.done() and pending.exception() is None:
+            embedding = pending.result()
+        if text and embedding is not None:
+            self.store(namespace, embedding, text)
@@ -4,6 +4,8 @@ Verifies that your environment is correctly configured
 """
 
 from dotenv import load_dotenv
+import asyncio
+import importlib.util
 import os
 import sys
 
@@ -39,12 +41,12 @@ def check_packages():
     
     results = {}
     
+    # find_spec only locates the package, without running its (slow) import
     for package_name, import_name in packages.items():
-        try:
-            __import__(import_name)
+        if importlib.util.find_spec(import_name) is not None:
             print(f"✓ {package_name:20} installed")
             results[package_name] = True
-        except ImportError:
+        else:
             print(f"✗ {package_name:20} NOT installed")
             results[package_name] = False
     
@@ -57,8 +59,8 @@ def check_env_file():
         print("\nPlease create a .env file with your API keys:")
         print("\nExample .env file content:")
         print("-"*60)
-        print("OPENAI_API_KEY= "YOUR_TOKEN_HERE"  # Replace with your token
-        print("ANTHROPIC_API_KEY= "YOUR_TOKEN_HERE"  # Replace with your token
+        print("OPENAI_API_KEY=your_openai_api_key")
+        print("ANTHROPIC_API_KEY=your_anthropic_api_key")
         print("-"*60)
         return False
     
@@ -94,18 +96,17 @@ def check_api_keys():
     
     return has_keys
 
-def test_openai_connection():
+async def test_openai_connection():
     """Test OpenAI API connection"""
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
-        
-        # Try a minimal API call
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": "Hi"}],
-            max_tokens=5
-        )
+        from openai import AsyncOpenAI
+        async with AsyncOpenAI(api_key=os.getenv("OPENAI_API_KEY")) as client:
+            # Try a minimal API call
+            response = await client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": "Hi"}],
+                max_tokens=5
+            )
         
         print("✓ OpenAI API connection successful")
         return True
@@ -114,18 +115,17 @@ def test_openai_connection():
         print(f"✗ OpenAI API connection failed: {str(e)[:100]}")
         return False
 
-def test_claude_connection():
+async def test_claude_connection():
     """Test Claude API connection"""
     try:
         import anthropic
-        client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
-        
-        # Try a minimal API call
-        message = client.messages.create(
-            model="claude-sonnet-4-20250514",
-            max_tokens=5,
-            messages=[{"role": "user", "content": "Hi"}]
-        )
+        async with anthropic.AsyncAnthropic(api_key=os.getenv("ANTHROPIC_API_KEY")) as client:
+            # Try a minimal API call
+            message = await client.messages.create(
+                model="claude-sonnet-4-20250514",
+                max_tokens=5,
+                messages=[{"role": "user", "content": "Hi"}]
+            )
         
         print("✓ Claude API connection successful")
         return True
@@ -134,6 +134,10 @@ def test_claude_connection():
         print(f"✗ Claude API connection failed: {str(e)[:100]}")
         return False
 
+async def run_connection_tests(connection_tests):
+    """Run the API connection tests concurrently"""
+    return await asyncio.gather(*connection_tests, return_exceptions=True)
+
 def main():
     print_header("🔍 Career Advisor Setup Test")
     
@@ -160,11 +164,15 @@ def main():
     if has_keys:
         print_section("5. Testing API Connections")
         
+        connection_tests = []
+        
         if packages.get('openai') and os.getenv("OPENAI_API_KEY"):
-            test_openai_connection()
+            connection_tests.append(test_openai_connection())
         
         if packages.get('anthropic') and os.getenv("ANTHROPIC_API_KEY"):
-            test_claude_connection()
+            connection_tests.append(test_claude_connection())
+        
+        asyncio.run(run_connection_tests(connection_tests))
     
     # Summary
     print_header("📋 Summary")
@@ -194,7 +202,7 @@ def main():
         print("  python cover_letter.py")
         print("  python resume_polisher.py")
         print("\nOr run all at once:")
-        print("  python run_all_apps.py")
+        print("  python app.py")
     else:
         print("\n⚠️  Please fix the issues above before running the applications.")
     